@@ -1,13 +1,30 @@
 """Python API for RSN DB — Rust engine with optional official MemPalace integration."""
 
-from ._core import Database, Query, Record
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .ai_memory import MemoryTurn, SessionMemory
-from . import beginners
-from .easy import RsnDatabase, open_db
 from .mempalace_bridge import MemPalaceBridge, MEMPALACE_INSTALL, OFFICIAL_DOCS
 
+if TYPE_CHECKING:
+    from ._core import Database, Query, Record
+    from . import beginners
+    from .easy import RsnDatabase, open_db
+
 __version__ = "0.4.6"
 
+# Names backed by the Rust extension load on first access, so ``rsn --help``
+# and other light entry points never map the shared library.
+_LAZY_ATTRS = {
+    "Database": "._core",
+    "Query": "._core",
+    "Record": "._core",
+    "RsnDatabase": ".easy",
+    "open_db": ".easy",
+}
+
 __all__ = [
     "Database",
     "Query",
@@ -22,3 +39,18 @@ __all__ = [
     "beginners",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "beginners":
+        value: Any = importlib.import_module(".beginners", __name__)
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
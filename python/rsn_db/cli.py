@@ -3,18 +3,52 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import select
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rsn_db import __version__
-from rsn_db._core import Database
 from rsn_db.help_menu import format_help, format_mempalace_help
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (pip install 'rsn_db[fast]')
+    orjson = None
+
+if TYPE_CHECKING:
+    from rsn_db._core import Database
+
 PREFS_FILE = Path.home() / ".rsn_preferences"
+# (path, blake2b digest) of the preferences bytes last read or written.
+_last_prefs_digest: tuple[Path, bytes] | None = None
 
 CLI_COMMANDS = ("rsn", "rsn-db")
 
+# Piped commands sent to the engine per ``execute_many`` call (engine max is 512).
+PIPE_BATCH_SIZE = 256
+_WRITE_CHUNK = 64 * 1024
+_READ_CHUNK = 64 * 1024
+
+_REPL_INTRO = "Type HELP for commands. MEMPALACE HELP, PULSE, MOOD, VITALS. EXIT to quit.\n"
+_REPL_BANNERS = {
+    "rsn-db": _REPL_INTRO + "  (Using rsn-db — Windows-friendly alias for rsn.)\n",
+}
+_EXIT_MSG = "Goodbye.\n"
+
+
+def __getattr__(name: str):
+    # ``Database`` is imported on first use so ``--help``, ``--version`` and the
+    # mode prompt never load the Rust extension.
+    if name == "Database":
+        from rsn_db._core import Database
+
+        globals()["Database"] = Database
+        return Database
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def cli_prog_name(argv: list[str] | None = None) -> str:
     """Return ``rsn-db`` when invoked via that entry point (Windows-friendly)."""
@@ -24,20 +58,90 @@ def cli_prog_name(argv: list[str] | None = None) -> str:
     return "rsn"
 
 
-def load_prefs() -> dict:
-    if PREFS_FILE.exists():
-        try:
-            return json.loads(PREFS_FILE.read_text())
-        except json.JSONDecodeError:
-            return {}
-    return {}
+def _loads(raw: bytes):
+    """Parse JSON straight from bytes (orjson when installed, no str decode pass)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _prefs_digest(raw: bytes) -> tuple[Path, bytes]:
+    return PREFS_FILE, hashlib.blake2b(raw, digest_size=16).digest()
+
+
+class Prefs:
+    """Saved CLI preferences (``~/.rsn_preferences``); unknown keys are kept as-is."""
+
+    _FIELDS = ("mode", "storage_path", "mempalace_path")
+    __slots__ = _FIELDS + ("_extra",)
+
+    def __init__(
+        self,
+        mode: str | None = None,
+        storage_path: str | None = None,
+        mempalace_path: str | None = None,
+    ) -> None:
+        self.mode = mode
+        self.storage_path = storage_path
+        self.mempalace_path = mempalace_path
+        # Keys written by other versions, carried through ``to_dict`` untouched.
+        self._extra: dict = {}
+
+    @classmethod
+    def from_dict(cls, data) -> Prefs:
+        if not isinstance(data, dict):
+            return cls()
+        prefs = cls(**{key: data.get(key) for key in cls._FIELDS})
+        prefs._extra = {key: value for key, value in data.items() if key not in cls._FIELDS}
+        return prefs
 
+    def to_dict(self) -> dict:
+        known = {key: getattr(self, key) for key in self._FIELDS if getattr(self, key) is not None}
+        return {**self._extra, **known}
 
-def save_prefs(prefs: dict) -> None:
-    PREFS_FILE.write_text(json.dumps(prefs))
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Prefs):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
 
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"Prefs({fields})"
 
-def _handle_mempalace(line: str, prefs: dict) -> bool:
+
+def load_prefs() -> Prefs:
+    global _last_prefs_digest
+    try:
+        with open(PREFS_FILE, "rb") as handle:
+            raw = handle.read()
+    except FileNotFoundError:
+        _last_prefs_digest = None
+        return Prefs()
+    _last_prefs_digest = _prefs_digest(raw)
+    try:
+        return Prefs.from_dict(_loads(raw))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return Prefs()
+
+
+def save_prefs(prefs: Prefs) -> None:
+    """Write preferences, skipping the write when the file already holds these bytes."""
+    global _last_prefs_digest
+    raw = _dumps(prefs.to_dict())
+    digest = _prefs_digest(raw)
+    if digest == _last_prefs_digest:
+        return
+    PREFS_FILE.write_bytes(raw)
+    _last_prefs_digest = digest
+
+
+def _handle_mempalace(line: str, prefs: Prefs) -> bool:
     upper = line.strip()
     if not upper.upper().startswith("MEMPALACE"):
         return False
@@ -49,13 +153,13 @@ def _handle_mempalace(line: str, prefs: dict) -> bool:
             file=sys.stderr,
         )
         return True
-    bridge = MemPalaceBridge(palace_path=prefs.get("mempalace_path"))
+    bridge = MemPalaceBridge(palace_path=prefs.mempalace_path)
     parts = upper.split(maxsplit=2)
     sub = parts[1].upper() if len(parts) > 1 else "HELP"
     rest = parts[2] if len(parts) > 2 else ""
     try:
         if sub in ("HELP", "?"):
-            print(format_mempalace_help(prefs.get("mode", "professional")))
+            print(format_mempalace_help(prefs.mode or "professional"))
         elif sub == "SEARCH" and rest:
             print(bridge.search_text(rest))
         elif sub == "REMEMBER" and rest:
@@ -75,50 +179,195 @@ def _handle_mempalace(line: str, prefs: dict) -> bool:
     return True
 
 
+def _write_bullets(items) -> None:
+    """Write `` • item`` lines in ~64 KiB blocks instead of one ``print`` per row."""
+    write = sys.stdout.write
+    buf: list[str] = []
+    size = 0
+    for item in items:
+        line = f" • {item}\n"
+        buf.append(line)
+        size += len(line)
+        if size >= _WRITE_CHUNK:
+            write("".join(buf))
+            buf.clear()
+            size = 0
+    if buf:
+        write("".join(buf))
+
+
+# execute_sql returns exact builtin types from Rust, so dispatch on type() directly.
+_RESULT_WRITERS = {list: _write_bullets}
+
+
 def _print_result(result, *, as_json: bool) -> None:
     if not result:
         return
     if as_json:
         print(json.dumps(result, default=str))
         return
-    if isinstance(result, list):
-        for item in result:
-            print(f" • {item}")
+    _RESULT_WRITERS.get(type(result), print)(result)
+
+
+class _PipedInput:
+    """
+    Line reader over a piped stdin's binary stream that can tell whether more
+    input is waiting, so the REPL knows when to stop batching and answer.
+    """
+
+    __slots__ = ("_read", "_fd", "_encoding", "_errors", "_buf", "_pos", "_eof")
+
+    def __init__(self, stream, encoding: str = "utf-8", errors: str = "strict") -> None:
+        self._read = getattr(stream, "read1", stream.read)
+        self._fd = stream.fileno()
+        self._encoding = encoding
+        self._errors = errors
+        self._buf = b""
+        self._pos = 0
+        self._eof = False
+
+    def ready(self) -> bool:
+        """True when ``readline`` can return without waiting on the writer."""
+        if self._eof or self._buf.find(b"\n", self._pos) >= 0:
+            return True
+        try:
+            return bool(select.select([self._fd], [], [], 0)[0])
+        except (OSError, ValueError):  # e.g. pipes on Windows: treat as idle
+            return False
+
+    def readline(self) -> str:
+        """Return the next line with its newline, or ``""`` at EOF."""
+        buf, pos = self._buf, self._pos
+        end = buf.find(b"\n", pos)
+        while end < 0 and not self._eof:
+            # Like ``input()``, show pending output before a read that may block.
+            sys.stdout.flush()
+            chunk = self._read(_READ_CHUNK)
+            if not chunk:
+                self._eof = True
+                break
+            scanned = len(buf) - pos
+            buf = self._buf = buf[pos:] + chunk
+            pos = 0
+            end = buf.find(b"\n", scanned)
+        stop = len(buf) if end < 0 else end + 1
+        self._pos = stop
+        return buf[pos:stop].decode(self._encoding, self._errors)
+
+    def input(self, prompt: str = "") -> str:
+        """``input()`` over this reader, so prompts never steal buffered REPL lines."""
+        sys.stdout.write(prompt)
+        line = self.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
+
+def _piped_stdin() -> _PipedInput | None:
+    """Return a reader for ``sys.stdin`` when it is a real pipe or file rather than a terminal."""
+    stdin = sys.stdin
+    try:
+        if stdin.isatty():
+            return None
+        return _PipedInput(stdin.buffer, stdin.encoding or "utf-8", stdin.errors or "strict")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _repl_lines(prog: str, piped: _PipedInput | None = None):
+    """Yield stripped REPL input: buffered reads when piped, ``input()`` on a TTY."""
+    if piped is not None:
+        for raw in iter(piped.readline, ""):
+            yield raw.strip()
+        return
+    read, prompt = input, f"{prog}> "
+    while True:
+        try:
+            yield read(prompt).strip()
+        except EOFError:
+            return
+
+
+def _local_command(line: str) -> str | None:
+    """Return ``"EXIT"``, ``"HELP"`` or ``"MEMPALACE"`` for REPL commands handled in Python."""
+    if len(line) <= 4:
+        upper = line.upper()
+        if upper == "EXIT":
+            return "EXIT"
+        return "HELP" if upper in ("HELP", "?") else None
+    return "MEMPALACE" if line[:9].upper() == "MEMPALACE" else None
+
+
+def _execute_and_print(execute, line: str, *, json_out: bool) -> None:
+    try:
+        _print_result(execute(line), as_json=json_out)
+    except Exception as exc:
+        print(exc, file=sys.stderr)
+
+
+def _flush_pending(db: Database, pending: list[str], *, json_out: bool) -> None:
+    """Run queued piped commands in one engine call and print results in order."""
+    try:
+        results = db.execute_many(pending)
+    except Exception:
+        # execute_many rejects the whole batch before running anything (e.g. a line
+        # PyO3 cannot encode), so run the commands one by one and fail only that line.
+        for line in pending:
+            _execute_and_print(db.execute_sql, line, json_out=json_out)
     else:
-        print(result)
+        for result in results:
+            if isinstance(result, BaseException):
+                print(result, file=sys.stderr)
+                continue
+            try:
+                _print_result(result, as_json=json_out)
+            except Exception as exc:
+                print(exc, file=sys.stderr)
+    pending.clear()
 
 
 def run_repl(
     db: Database,
-    prefs: dict,
+    prefs: Prefs,
     *,
     json_out: bool,
     mode: str = "professional",
     prompt: str | None = None,
+    piped: _PipedInput | None = None,
 ) -> None:
-    prefs = {**prefs, "mode": mode}
+    """Run the shell; ``piped`` is a non-TTY stdin to read from instead of ``input()``."""
+    prefs = Prefs.from_dict({**prefs.to_dict(), "mode": mode})
     prog = prompt or cli_prog_name()
-    print(f"Type HELP for commands. MEMPALACE HELP, PULSE, MOOD, VITALS. EXIT to quit.")
-    if prog == "rsn-db":
-        print("  (Using rsn-db — Windows-friendly alias for rsn.)")
-    while True:
-        try:
-            line = input(f"{prog}> ").strip()
-        except EOFError:
-            break
-        if line.upper() == "EXIT":
+    # Piped engine commands are queued and sent via ``execute_many`` in chunks of up
+    # to PIPE_BATCH_SIZE, or as soon as no further input is waiting.
+    pending: list[str] = []
+    sys.stdout.write(_REPL_BANNERS.get(prog, _REPL_INTRO))
+    # Hot-loop names bound as locals (LOAD_FAST instead of global/builtin lookups).
+    local_command, execute_and_print = _local_command, _execute_and_print
+    execute = db.execute_sql
+    for line in _repl_lines(prog, piped):
+        local = local_command(line)
+        if local is None:
+            if piped is None:
+                execute_and_print(execute, line, json_out=json_out)
+                continue
+            pending.append(line)
+            if len(pending) >= PIPE_BATCH_SIZE or not piped.ready():
+                _flush_pending(db, pending, json_out=json_out)
+            continue
+        if pending:
+            _flush_pending(db, pending, json_out=json_out)
+        if local == "EXIT":
             db.save()
-            print("Goodbye.")
+            sys.stdout.write(_EXIT_MSG)
             break
-        if _handle_mempalace(line, prefs):
-            continue
-        if line.upper() in ("HELP", "?"):
+        if local == "HELP":
             print(format_help(mode))
-            continue
-        try:
-            _print_result(db.execute_sql(line), as_json=json_out)
-        except Exception as exc:
-            print(exc, file=sys.stderr)
+        else:
+            _handle_mempalace(line, prefs)
+    else:
+        if pending:
+            _flush_pending(db, pending, json_out=json_out)
 
 
 def build_parser(prog: str | None = None) -> argparse.ArgumentParser:
@@ -128,9 +377,9 @@ def build_parser(prog: str | None = None) -> argparse.ArgumentParser:
         description="RSN DB interactive shell and one-shot SQL runner.",
         epilog=(
             "Examples:\n"
-            f"  {{name}} -c 'SHOW TABLES'\n"
-            f"  {{name}} --mode snarky\n"
-            f"  {{name}} --storage ./app.rsndb -c 'PULSE'\n\n"
+            "  {name} -c 'SHOW TABLES'\n"
+            "  {name} --mode snarky\n"
+            "  {name} --storage ./app.rsndb -c 'PULSE'\n\n"
             "On Windows, if ``rsn`` conflicts with another program, use ``rsn-db`` "
             "(same command; installed as a second console script)."
         ).format(name=name),
@@ -161,19 +410,23 @@ def main(argv: list[str] | None = None) -> int:
     argv = list(sys.argv[1:] if argv is None else argv)
     args = build_parser().parse_args(argv)
     prefs = load_prefs()
-    mode = args.mode or prefs.get("mode")
+    mode = args.mode or prefs.mode
+    piped = _piped_stdin()
     if not mode and not args.no_prompt and not args.command:
+        ask = input if piped is None else piped.input
         print("Select mode: [1] Professional  [2] Friendly  [3] Snarky")
-        choice = input("Choice (default 1): ").strip()
+        choice = ask("Choice (default 1): ").strip()
         mode = {"2": "friendly", "3": "snarky"}.get(choice, "professional")
-        if input("Remember? (y/n): ").strip().lower() == "y":
-            prefs["mode"] = mode
+        if ask("Remember? (y/n): ").strip().lower() == "y":
+            prefs.mode = mode
             save_prefs(prefs)
     mode = mode or "professional"
-    storage = args.storage or prefs.get("storage_path")
+    storage = args.storage or prefs.storage_path
+    from rsn_db._core import Database
+
     db = Database(storage_path=storage, mode=mode)
 
-    prefs["mode"] = mode
+    prefs.mode = mode
     if args.command:
         cmd_upper = args.command.strip().upper()
         if cmd_upper in ("HELP", "?"):
@@ -191,7 +444,7 @@ def main(argv: list[str] | None = None) -> int:
 
     if mode == "snarky":
         print(db.execute_sql("PULSE") or "Snarky mode on.")
-    run_repl(db, prefs, json_out=args.json, mode=mode)
+    run_repl(db, prefs, json_out=args.json, mode=mode, piped=piped)
     return 0
 
 
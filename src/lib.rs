@@ -29,7 +29,6 @@ use sha2::{Digest, Sha256};
 use std::cmp::Ordering;
 use std::collections::{HashMap, HashSet};
 use std::fs;
-use std::io::{BufRead, BufReader};
 use std::path::{Component, PathBuf};
 use thiserror::Error;
 use zstd::stream::{decode_all, encode_all};
@@ -620,6 +619,24 @@ impl Database {
         Ok(out)
     }
 
+    /// Run several commands in one call; a failing command yields its exception object.
+    fn execute_many(&mut self, py: Python<'_>, commands: Vec<String>) -> PyResult<Vec<PyObject>> {
+        if commands.len() > MAX_BATCH_OPS {
+            return Err(PyValueError::new_err(format!(
+                "Batch operation limit exceeded (max {})",
+                MAX_BATCH_OPS
+            )));
+        }
+        let mut results = Vec::with_capacity(commands.len());
+        for sql in commands {
+            match self.execute_sql(py, sql) {
+                Ok(out) => results.push(out),
+                Err(err) => results.push(err.into_value(py).into_py(py)),
+            }
+        }
+        Ok(results)
+    }
+
     fn execute_sql_recursive(
         &mut self,
         py: Python<'_>,
@@ -803,14 +820,13 @@ impl Database {
             .tables
             .get(&table)
             .ok_or_else(|| PyKeyError::new_err("missing table"))?;
-        let mut out = String::new();
+        let mut out: Vec<u8> = Vec::new();
         for (id, r) in &t.records {
             let mut m = r.clone();
             m.insert("id".into(), Value::Number((*id).into()));
-            let row = serde_json::to_string(&Value::Object(m))
+            serde_json::to_writer(&mut out, &Value::Object(m))
                 .map_err(|e| PyValueError::new_err(e.to_string()))?;
-            out.push_str(&row);
-            out.push('\n');
+            out.push(b'\n');
         }
         let output_path = sanitize_user_path(&dest)?;
         fs::write(output_path, out).map_err(|e| PyIOError::new_err(e.to_string()))
@@ -824,26 +840,32 @@ impl Database {
                 MAX_JSONL_IMPORT_BYTES
             )));
         }
-        let file = fs::File::open(source_path).map_err(|e| PyIOError::new_err(e.to_string()))?;
-        let reader = BufReader::new(file);
+        // The file is capped at MAX_JSONL_IMPORT_BYTES, so read it in one go and
+        // parse each row straight from its byte slice (no per-line String).
+        let bytes = fs::read(source_path).map_err(|e| PyIOError::new_err(e.to_string()))?;
+        let body = bytes.strip_suffix(b"\n").unwrap_or(&bytes[..]);
+        // Enforce the row limit before any row is inserted. The SIMD newline count
+        // (memchr) settles most files; only near the limit are blank lines excluded.
+        let is_blank = |line: &[u8]| line.iter().all(u8::is_ascii_whitespace);
+        if memchr::memchr_iter(b'\n', body).count() >= MAX_JSONL_IMPORT_LINES
+            && body.split(|b| *b == b'\n').filter(|l| !is_blank(l)).count() > MAX_JSONL_IMPORT_LINES
+        {
+            return Err(PyValueError::new_err(format!(
+                "JSONL import exceeds max line count of {}",
+                MAX_JSONL_IMPORT_LINES
+            )));
+        }
         let t = self
             .engine
             .tables
             .get_mut(&table)
             .ok_or_else(|| PyKeyError::new_err("missing table"))?;
         let mut count = 0;
-        for line_result in reader.lines() {
-            if count >= MAX_JSONL_IMPORT_LINES {
-                return Err(PyValueError::new_err(format!(
-                    "JSONL import exceeds max line count of {}",
-                    MAX_JSONL_IMPORT_LINES
-                )));
-            }
-            let line = line_result.map_err(|e| PyIOError::new_err(e.to_string()))?;
-            if line.trim().is_empty() {
+        for line in body.split(|b| *b == b'\n') {
+            if is_blank(line) {
                 continue;
             }
-            let mut payload: Map<String, Value> = serde_json::from_str(&line)
+            let mut payload: Map<String, Value> = serde_json::from_slice(line)
                 .map_err(|e| PyValueError::new_err(format!("invalid JSONL row: {}", e)))?;
             payload.remove("id");
             t.insert(payload).map_err(convert_db_error)?;
@@ -62,3 +62,17 @@ def test_rsn_db_console_script_version():
     r = subprocess.run(["rsn-db", "--version"], capture_output=True, text=True)
     assert r.returncode == 0
     assert "0.4" in r.stdout
+
+
+def test_cli_help_does_not_load_rust_extension():
+    code = (
+        "import sys, rsn_db.cli as cli\n"
+        "try:\n"
+        "    cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('rsn_db._core' in sys.modules)\n"
+    )
+    r = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert r.returncode == 0, r.stderr
+    assert r.stdout.strip().endswith("False")
@@ -10,12 +10,75 @@ def test_load_save_prefs(tmp_path, monkeypatch):
 
     prefs_file = tmp_path / "prefs.json"
     monkeypatch.setattr(cli, "PREFS_FILE", prefs_file)
-    cli.save_prefs({"mode": "snarky"})
-    assert cli.load_prefs()["mode"] == "snarky"
+    cli.save_prefs(cli.Prefs(mode="snarky"))
+    assert cli.load_prefs().mode == "snarky"
+
+
+def test_save_prefs_skips_unchanged_write(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from rsn_db import cli
+
+    prefs_file = tmp_path / "prefs.json"
+    monkeypatch.setattr(cli, "PREFS_FILE", prefs_file)
+    cli.save_prefs(cli.Prefs(mode="snarky"))
+    with patch.object(Path, "write_bytes") as write:
+        cli.save_prefs(cli.Prefs(mode="snarky"))
+        write.assert_not_called()
+        cli.save_prefs(cli.Prefs(mode="friendly"))
+        write.assert_called_once()
+
+    other = tmp_path / "other.json"
+    monkeypatch.setattr(cli, "PREFS_FILE", other)
+    cli.save_prefs(cli.Prefs(mode="friendly"))
+    assert cli.load_prefs() == cli.Prefs(mode="friendly")
+
+
+def test_prefs_from_dict_keeps_unknown_and_ignores_non_dict():
+    from rsn_db.cli import Prefs
+
+    prefs = Prefs.from_dict({"mode": "snarky", "storage_path": "a.rsndb", "extra": 1})
+    assert prefs.mode == "snarky"
+    assert prefs.to_dict() == {"mode": "snarky", "storage_path": "a.rsndb", "extra": 1}
+    assert Prefs.from_dict(["mode"]) == Prefs()
+    assert "snarky" in repr(prefs)
+    with pytest.raises(AttributeError):
+        prefs.extra = 1
+
+
+def test_save_prefs_round_trips_unknown_keys(tmp_path, monkeypatch):
+    from rsn_db import cli
+
+    prefs_file = tmp_path / "prefs.json"
+    prefs_file.write_text('{"mode": "snarky", "theme": "dark"}', encoding="utf-8")
+    monkeypatch.setattr(cli, "PREFS_FILE", prefs_file)
+    prefs = cli.load_prefs()
+    prefs.mode = "friendly"
+    cli.save_prefs(prefs)
+    assert cli.load_prefs().to_dict() == {"mode": "friendly", "theme": "dark"}
+
+
+def test_load_prefs_missing_file(tmp_path, monkeypatch):
+    from rsn_db import cli
+
+    monkeypatch.setattr(cli, "PREFS_FILE", tmp_path / "absent.json")
+    assert cli.load_prefs() == cli.Prefs()
+
+
+def test_load_save_prefs_without_orjson(tmp_path, monkeypatch):
+    from rsn_db import cli
+
+    prefs_file = tmp_path / "prefs.json"
+    monkeypatch.setattr(cli, "PREFS_FILE", prefs_file)
+    monkeypatch.setattr(cli, "orjson", None)
+    cli.save_prefs(cli.Prefs(mode="friendly"))
+    assert cli.load_prefs() == cli.Prefs(mode="friendly")
+    prefs_file.write_bytes(b"\xff\xfe{")
+    assert cli.load_prefs() == cli.Prefs()
 
 
 def test_handle_mempalace_subcommands():
-    from rsn_db.cli import _handle_mempalace
+    from rsn_db.cli import Prefs, _handle_mempalace
 
     with patch("rsn_db.mempalace_bridge.MemPalaceBridge") as cls:
         inst = cls.return_value
@@ -32,7 +95,7 @@ def test_handle_mempalace_subcommands():
             "MEMPALACE MINE .",
             "MEMPALACE HELP",
         ):
-            assert _handle_mempalace(cmd, {}) is True
+            assert _handle_mempalace(cmd, Prefs()) is True
 
 
 def test_print_result_json(capsys):
@@ -50,10 +113,31 @@ def test_print_result_list_plain(capsys):
     assert "x" in capsys.readouterr().out
 
 
+def test_print_result_large_list_chunks(capsys):
+    from rsn_db.cli import _print_result
+
+    rows = [f"row{i:05d}" for i in range(20_000)]
+    _print_result(rows, as_json=False)
+    out = capsys.readouterr().out
+    assert out == "".join(f" • {r}\n" for r in rows)
+
+
+def test_repl_repeated_reads_reach_engine_history(monkeypatch, capsys):
+    from rsn_db import Database
+    from rsn_db.cli import Prefs, run_repl
+
+    db = Database()
+    inputs = iter(["TABLES", "TABLES", "HISTORY", "EXIT"])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    run_repl(db, Prefs(), json_out=False)
+    out = capsys.readouterr().out
+    assert out.count(" • TABLES") == 2
+
+
 def test_main_error_exit(tmp_path):
     from rsn_db import cli
 
-    with patch.object(cli, "Database") as db_cls:
+    with patch("rsn_db._core.Database") as db_cls:
         db_cls.return_value.execute_sql.side_effect = ValueError("x")
         assert (
             cli.main(
@@ -72,7 +156,7 @@ def test_main_error_exit(tmp_path):
 def test_main_json_output(tmp_path, capsys):
     from rsn_db import cli
 
-    with patch.object(cli, "Database") as db_cls:
+    with patch("rsn_db._core.Database") as db_cls:
         db_cls.return_value.execute_sql.return_value = ["t"]
         assert (
             cli.main(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,31 +14,31 @@ def test_load_prefs_invalid_json(tmp_path, monkeypatch):
     prefs_file = tmp_path / "prefs.json"
     prefs_file.write_text("{not json", encoding="utf-8")
     monkeypatch.setattr(cli, "PREFS_FILE", prefs_file)
-    assert cli.load_prefs() == {}
+    assert cli.load_prefs() == cli.Prefs()
 
 
 def test_handle_mempalace_import_unavailable(capsys):
-    from rsn_db.cli import _handle_mempalace
+    from rsn_db.cli import Prefs, _handle_mempalace
 
     with patch.dict(
         "sys.modules",
         {"rsn_db.mempalace_bridge": None},
     ):
-        assert _handle_mempalace("MEMPALACE SEARCH q", {}) is True
+        assert _handle_mempalace("MEMPALACE SEARCH q", Prefs()) is True
     assert "MemPalace unavailable" in capsys.readouterr().err
 
 
 def test_handle_mempalace_unknown_and_error(capsys):
-    from rsn_db.cli import _handle_mempalace
+    from rsn_db.cli import Prefs, _handle_mempalace
 
     with patch("rsn_db.mempalace_bridge.MemPalaceBridge") as cls:
         inst = cls.return_value
         inst.search_text.side_effect = RuntimeError("boom")
-        assert _handle_mempalace("MEMPALACE SEARCH q", {}) is True
+        assert _handle_mempalace("MEMPALACE SEARCH q", Prefs()) is True
         assert "MemPalace error" in capsys.readouterr().err
 
     with patch("rsn_db.mempalace_bridge.MemPalaceBridge"):
-        assert _handle_mempalace("MEMPALACE NOPE", {}) is True
+        assert _handle_mempalace("MEMPALACE NOPE", Prefs()) is True
         assert "Unknown MEMPALACE" in capsys.readouterr().err
 
 
@@ -53,7 +54,7 @@ def test_print_result_empty_and_scalar(capsys):
 
 
 def test_run_repl_paths(monkeypatch, capsys):
-    from rsn_db.cli import run_repl
+    from rsn_db.cli import Prefs, run_repl
 
     db = MagicMock()
     db.execute_sql.return_value = ["row"]
@@ -61,14 +62,15 @@ def test_run_repl_paths(monkeypatch, capsys):
     monkeypatch.setattr("builtins.input", lambda _: next(inputs))
 
     with patch("rsn_db.cli._handle_mempalace", side_effect=[False, False, True, False]):
-        run_repl(db, {}, json_out=False)
+        run_repl(db, Prefs(), json_out=False)
     out = capsys.readouterr().out
     assert "TABLES" in out
+    assert out.endswith("Goodbye.\n")
     db.save.assert_called_once()
 
 
 def test_run_repl_eof_and_sql_error(monkeypatch, capsys):
-    from rsn_db.cli import run_repl
+    from rsn_db.cli import Prefs, run_repl
 
     db = MagicMock()
     db.execute_sql.side_effect = ValueError("bad sql")
@@ -81,23 +83,185 @@ def test_run_repl_eof_and_sql_error(monkeypatch, capsys):
         return val
 
     monkeypatch.setattr("builtins.input", fake_input)
-    run_repl(db, {}, json_out=True)
+    run_repl(db, Prefs(), json_out=True)
     err = capsys.readouterr().err
     assert "bad sql" in err
 
 
+def test_run_repl_piped_stdin(tmp_path, monkeypatch, capsys):
+    from rsn_db.cli import Prefs, _PipedInput, run_repl
+
+    script = tmp_path / "cmds.txt"
+    script.write_text("TABLES\n  COUNT users  \nEXIT\nTABLES\n", encoding="utf-8")
+    sent = []
+    db = MagicMock()
+    db.execute_many.side_effect = lambda cmds: (
+        sent.append(list(cmds)) or [["row"], ValueError("missing table")]
+    )
+
+    def no_input(_):
+        raise AssertionError("input() used for piped stdin")
+
+    monkeypatch.setattr("builtins.input", no_input)
+    with script.open("rb") as handle:
+        run_repl(db, Prefs(), json_out=False, piped=_PipedInput(handle))
+    assert sent == [["TABLES", "COUNT users"]]
+    db.execute_sql.assert_not_called()
+    captured = capsys.readouterr()
+    assert "rsn>" not in captured.out
+    assert " • row" in captured.out
+    assert "missing table" in captured.err
+    db.save.assert_called_once()
+
+
+def test_run_repl_piped_flushes_on_eof_and_chunk_size(tmp_path, monkeypatch):
+    from rsn_db import cli
+
+    script = tmp_path / "cmds.txt"
+    script.write_text("PULSE\n" * 5, encoding="utf-8")
+    sizes = []
+
+    def execute_many(cmds):
+        sizes.append(len(cmds))
+        return ["ok"] * len(cmds)
+
+    db = MagicMock()
+    db.execute_many.side_effect = execute_many
+    monkeypatch.setattr(cli, "PIPE_BATCH_SIZE", 2)
+    with script.open("rb") as handle:
+        cli.run_repl(db, cli.Prefs(), json_out=False, piped=cli._PipedInput(handle))
+    assert sizes == [2, 2, 1]
+    db.save.assert_not_called()
+
+
+def test_run_repl_piped_batch_failure_falls_back_per_command(tmp_path, capsys):
+    from rsn_db import cli
+
+    class Unprintable:
+        def __str__(self):
+            raise ValueError("cannot render")
+
+    def strict(cmds):
+        for cmd in cmds:
+            cmd.encode("utf-8")  # PyO3's Vec<String> conversion is strict UTF-8
+        return [[Unprintable()], ["ok"]]
+
+    script = tmp_path / "cmds.txt"
+    script.write_bytes(b"TABLES\nCOUNT \xff\nTABLES\nEXIT\n")
+    db = MagicMock()
+    db.execute_many.side_effect = strict
+    db.execute_sql.side_effect = lambda cmd: strict([cmd]) and [cmd]
+    with script.open("rb") as handle:
+        piped = cli._PipedInput(handle, errors="surrogateescape")
+        cli.run_repl(db, cli.Prefs(), json_out=False, piped=piped)
+    captured = capsys.readouterr()
+    assert captured.out.count(" • TABLES") == 2
+    assert "surrogates not allowed" in captured.err
+    db.save.assert_called_once()
+
+    # A result that fails to print reports its error without dropping the rest.
+    script.write_bytes(b"PULSE\nVITALS\n")
+    with script.open("rb") as handle:
+        cli.run_repl(db, cli.Prefs(), json_out=False, piped=cli._PipedInput(handle))
+    captured = capsys.readouterr()
+    assert "cannot render" in captured.err
+    assert " • ok" in captured.out
+
+
+def test_piped_input_ready_tracks_pipe_state():
+    import os
+
+    from rsn_db.cli import _PipedInput
+
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "rb") as reader:
+        piped = _PipedInput(reader)
+        assert not piped.ready()
+        os.write(write_fd, b"TABLES\nPUL")
+        assert piped.ready()
+        assert piped.readline() == "TABLES\n"
+        assert not piped.ready()
+        os.write(write_fd, "SE \u2713\n".encode("utf-8"))
+        assert piped.readline() == "PULSE \u2713\n"
+        os.close(write_fd)
+        assert piped.ready()
+        with pytest.raises(EOFError):
+            piped.input("Choice: ")
+        assert piped.readline() == ""
+
+
+def test_run_repl_piped_answers_before_eof(monkeypatch):
+    import os
+    import threading
+
+    from rsn_db import cli
+
+    answered = threading.Event()
+    sent = []
+
+    def execute_many(cmds):
+        sent.append(list(cmds))
+        answered.set()
+        return ["ok"] * len(cmds)
+
+    db = MagicMock()
+    db.execute_many.side_effect = execute_many
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "rb") as reader:
+        repl = threading.Thread(
+            target=cli.run_repl,
+            args=(db, cli.Prefs()),
+            kwargs={"json_out": False, "piped": cli._PipedInput(reader)},
+        )
+        repl.start()
+        os.write(write_fd, b"TABLES\n")
+        # A lone command is answered while the writer keeps the pipe open.
+        assert answered.wait(5)
+        os.close(write_fd)
+        repl.join(5)
+    assert not repl.is_alive()
+    assert sent == [["TABLES"]]
+
+
+def test_cli_database_attribute_loads_once(monkeypatch):
+    from rsn_db import _core, cli
+
+    monkeypatch.delitem(vars(cli), "Database", raising=False)
+    assert cli.Database is _core.Database
+    assert vars(cli)["Database"] is _core.Database
+    with pytest.raises(AttributeError):
+        cli.NotThere
+
+
+def test_piped_stdin_detection(tmp_path, monkeypatch):
+    from rsn_db.cli import _piped_stdin
+
+    script = tmp_path / "cmds.txt"
+    script.write_text("TABLES\n", encoding="utf-8")
+    with script.open(encoding="utf-8") as handle:
+        monkeypatch.setattr("sys.stdin", handle)
+        piped = _piped_stdin()
+        assert piped.readline() == "TABLES\n"
+        assert piped.readline() == ""
+    monkeypatch.setattr("sys.stdin", MagicMock(isatty=MagicMock(return_value=True)))
+    assert _piped_stdin() is None
+    monkeypatch.setattr("sys.stdin", io.StringIO("TABLES\n"))
+    assert _piped_stdin() is None
+
+
 def test_main_interactive_mode_selection(tmp_path, monkeypatch):
     from rsn_db import cli
 
     monkeypatch.setattr(cli, "PREFS_FILE", tmp_path / "prefs.json")
     monkeypatch.setattr(cli, "run_repl", lambda *a, **k: None)
+    monkeypatch.setattr(cli, "_piped_stdin", lambda: None)
     inputs = iter(["3", "y"])
     monkeypatch.setattr("builtins.input", lambda _: next(inputs))
 
-    with patch.object(cli, "Database") as db_cls:
+    with patch("rsn_db._core.Database") as db_cls:
         db_cls.return_value.execute_sql.return_value = "pulse"
         assert cli.main([]) == 0
-    assert cli.load_prefs().get("mode") == "snarky"
+    assert cli.load_prefs().mode == "snarky"
 
 
 def test_main_snarky_starts_repl(monkeypatch):
@@ -105,11 +269,11 @@ def test_main_snarky_starts_repl(monkeypatch):
 
     called = []
 
-    def capture_repl(db, prefs, *, json_out, mode="professional", prompt=None):
+    def capture_repl(db, prefs, *, json_out, mode="professional", prompt=None, piped=None):
         called.append(json_out)
 
     monkeypatch.setattr(cli, "run_repl", capture_repl)
-    with patch.object(cli, "Database") as db_cls:
+    with patch("rsn_db._core.Database") as db_cls:
         db_cls.return_value.execute_sql.return_value = "alive"
         assert cli.main(["--no-prompt", "--mode", "snarky"]) == 0
     assert called == [False]
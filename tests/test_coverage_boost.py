@@ -105,12 +105,12 @@ def test_cli_parser_and_one_shot(tmp_path):
 
 
 def test_cli_mempalace_branch(capsys):
-    from rsn_db.cli import _handle_mempalace
+    from rsn_db.cli import Prefs, _handle_mempalace
 
     with patch("rsn_db.mempalace_bridge.MemPalaceBridge") as cls:
         inst = cls.return_value
         inst.search_text.return_value = "hits"
-        assert _handle_mempalace("MEMPALACE SEARCH hello", {}) is True
+        assert _handle_mempalace("MEMPALACE SEARCH hello", Prefs()) is True
         assert "hits" in capsys.readouterr().out
 
 
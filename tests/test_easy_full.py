@@ -57,3 +57,11 @@ def test_open_db_context(tmp_path):
     with open_db(str(tmp_path / "o.rsndb")) as db:
         db.create_table("z", {"n": {"type": "string", "required": True}})
     assert (tmp_path / "o.rsndb").exists()
+
+
+def test_repeated_describe_reaches_engine_history(tmp_path):
+    db = RsnDatabase(str(tmp_path / "d.rsndb"), session_memory=False)
+    db.create_table("users", {"name": {"type": "string", "required": True}})
+    assert db.execute_sql("DESCRIBE users") == ["name"]
+    assert db.execute_sql("DESCRIBE users") == ["name"]
+    assert db.execute_sql("HISTORY").count("DESCRIBE users") == 2
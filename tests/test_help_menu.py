@@ -50,7 +50,7 @@ def test_mempalace_help_sorted():
 def test_cli_repl_help_command(capsys):
     from unittest.mock import MagicMock
 
-    from rsn_db.cli import run_repl
+    from rsn_db.cli import Prefs, run_repl
 
     db = MagicMock()
     inputs = iter(["HELP", "EXIT"])
@@ -60,7 +60,7 @@ def test_cli_repl_help_command(capsys):
     real_input = builtins.input
     builtins.input = lambda _: next(inputs)
     try:
-        run_repl(db, {}, json_out=False, mode="snarky", prompt="rsn-db")
+        run_repl(db, Prefs(), json_out=False, mode="snarky", prompt="rsn-db")
     finally:
         builtins.input = real_input
 
@@ -2,6 +2,20 @@ from rsn_db import Database, Query
 import pytest
 import os
 
+USERS_SCHEMA = {
+    "name": {"type": "string", "required": True},
+    "email": {"type": "string", "required": True, "unique": True},
+}
+
+
+@pytest.fixture
+def users_db(tmp_path):
+    # Fresh users table under tmp_path, so tests never share state or litter the cwd.
+    db = Database(str(tmp_path / "state.rsndb"))
+    db.create_table("users", USERS_SCHEMA)
+    return db
+
+
 def test_end_to_end(tmp_path):
     # Use relative path for db
     db = Database(str(tmp_path / "state.rsndb"))
@@ -42,19 +56,9 @@ def test_end_to_end(tmp_path):
 
     assert db.execute_sql("COUNT users") == 2
 
-def test_unknown_field_rejected(tmp_path):
-    db = Database("state2.rsndb")
-    db.create_table(
-        "users",
-        {
-            "name": {"type": "string", "required": True},
-            "email": {"type": "string", "required": True, "unique": True},
-        },
-    )
-
+def test_unknown_field_rejected(users_db):
     with pytest.raises(ValueError, match="not part of the schema"):
-        db.insert("users", {"name": "Eve", "email": "eve@example.com", "role": "admin"})
-    if os.path.exists("state2.rsndb"): os.remove("state2.rsndb")
+        users_db.insert("users", {"name": "Eve", "email": "eve@example.com", "role": "admin"})
 
 def test_jsonl_and_sqlite_roundtrip(tmp_path):
     db = Database("state3.rsndb")
@@ -128,41 +132,49 @@ def test_command_safety_and_discovery_features(tmp_path):
     assert "TABLES" in history
     if os.path.exists("state4.rsndb"): os.remove("state4.rsndb")
 
-def test_path_traversal_rejected(tmp_path):
-    db = Database("state5.rsndb")
-    db.create_table(
-        "users",
-        {
-            "name": {"type": "string", "required": True},
-            "email": {"type": "string", "required": True, "unique": True},
-        },
-    )
-    db.insert("users", {"name": "Ana", "email": "ana@example.com"})
+def test_path_traversal_rejected(users_db):
+    users_db.insert("users", {"name": "Ana", "email": "ana@example.com"})
 
     with pytest.raises(ValueError, match="Potential path traversal"):
-        db.export_jsonl("users", "../unsafe.jsonl")
+        users_db.export_jsonl("users", "../unsafe.jsonl")
 
     with pytest.raises(ValueError, match="Potential path traversal"):
-        db.import_sqlite("users", "../unsafe.sqlite", "users")
-    if os.path.exists("state5.rsndb"): os.remove("state5.rsndb")
+        users_db.import_sqlite("users", "../unsafe.sqlite", "users")
 
 
-def test_sqlite_identifier_validation_blocks_injection_names(tmp_path):
-    db = Database(str(tmp_path / "state6.rsndb"))
-    db.create_table(
-        "users",
-        {
-            "name": {"type": "string", "required": True},
-            "email": {"type": "string", "required": True, "unique": True},
-        },
-    )
-    db.insert("users", {"name": "Ana", "email": "ana@example.com"})
+def test_sqlite_identifier_validation_blocks_injection_names(users_db, tmp_path):
+    users_db.insert("users", {"name": "Ana", "email": "ana@example.com"})
 
     with pytest.raises(ValueError, match="invalid identifier"):
-        db.export_sqlite("users]; DROP TABLE users; --", str(tmp_path / "safe.sqlite"))
+        users_db.export_sqlite("users]; DROP TABLE users; --", str(tmp_path / "safe.sqlite"))
 
     with pytest.raises(ValueError, match="invalid identifier"):
-        db.import_sqlite("users;bad", str(tmp_path / "safe.sqlite"), "users")
+        users_db.import_sqlite("users;bad", str(tmp_path / "safe.sqlite"), "users")
+
+
+def test_jsonl_import_skips_blank_and_crlf_lines(users_db, tmp_path):
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        with open("rows.jsonl", "wb") as handle:
+            handle.write(
+                b'{"name":"a","email":"a@x.com"}\r\n\n   \n{"name":"b","email":"b@x.com"}'
+            )
+        assert users_db.import_jsonl("users", "rows.jsonl") == 2
+        users_db.export_jsonl("users", "out.jsonl")
+        with open("out.jsonl", "rb") as handle:
+            assert handle.read().count(b"\n") == 2
+    finally:
+        os.chdir(cwd)
+
+
+def test_execute_many_returns_results_and_errors(users_db):
+    results = users_db.execute_many(["DESCRIBE users", "COUNT nope", "COUNT users"])
+    assert results[0] == ["email", "name"]
+    assert isinstance(results[1], KeyError)
+    assert results[2] == 0
+    with pytest.raises(ValueError, match="Batch operation limit exceeded"):
+        users_db.execute_many(["TABLES"] * 513)
 
 
 def test_dos_limits_command_batch_and_ingest(tmp_path):
@@ -211,5 +223,15 @@ def test_jsonl_import_limits(tmp_path):
 
         with pytest.raises(ValueError, match="JSONL import exceeds max line count"):
             db.import_jsonl("users", too_many_lines_path)
+        assert db.execute_sql("COUNT users") == 0
+
+        # Blank lines do not count toward the limit: a double-spaced file at the cap imports.
+        double_spaced_path = "double_spaced.jsonl"
+        with open(double_spaced_path, "w", encoding="utf-8") as handle:
+            for index in range(100000):
+                handle.write(row.format(index))
+                handle.write("\n")
+
+        assert db.import_jsonl("users", double_spaced_path) == 100000
     finally:
         os.chdir(cwd)
@@ -32,8 +32,8 @@ def test_rsn_database_delegate(tmp_path):
 
 
 def test_cli_mempalace_help(capsys):
-    from rsn_db.cli import _handle_mempalace
+    from rsn_db.cli import Prefs, _handle_mempalace
 
     with patch("rsn_db.mempalace_bridge.MemPalaceBridge"):
-        assert _handle_mempalace("MEMPALACE HELP", {}) is True
+        assert _handle_mempalace("MEMPALACE HELP", Prefs()) is True
     assert "SEARCH" in capsys.readouterr().out